@@ -6,6 +6,7 @@ class CompilerError(Exception):
     def __init__(self, message: str, line: int, column: int):
         self.line = line
         self.column = column
+        self.reason = message
         error_type = self.__class__.__name__.replace("Error", " Error")
         self.formatted = f"[Line {line}, Column {column}] {error_type} | {message}"
         super().__init__(self.formatted)
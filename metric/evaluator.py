@@ -10,7 +10,8 @@ This keeps the language semantics intact while giving you a simple, portable cos
 """
 
 from __future__ import annotations
-from typing import Optional, Sequence
+from operator import add, eq, ge, gt, le, lt, mul, ne, sub
+from typing import Any, Callable, Optional, Sequence
 from .metric_ast import *  
 
 
@@ -51,18 +52,29 @@ def ensure_integer(value: RuntimeValue) -> int:
 
 
 class Environment:
-    """Persistent environment mapping names ⇒ runtime values & functions.
-
-    Immutability for the *bindings* is preserved (each mutation returns a fresh
-    `Environment`), but a shared *cost* counter is held by reference so that
-    every copy sees the same running tally.
+    """Call frame mapping names ⇒ runtime values & functions.
+
+    Bindings are updated in place, so a `let`/`set` costs a dict store rather
+    than a copy of every binding in scope.  Each function invocation runs in
+    its own frame (see `new_frame()`), and a shared *cost* counter is held by
+    reference so that every frame sees the same running tally.  Program output
+    goes to the same shared sink from every frame (stdout when there is none).
+    Mutators still return the environment so calls can be chained.
+
+    Lists have value semantics but are shared between bindings until written
+    (copy-on-write).  A frame records in `_owned` the names whose list it has
+    already copied; later element writes to those lists happen in place.  Any
+    read that lets the list escape (`find`) or rebinding the name gives up
+    ownership again.
     """
 
-    def __init__(self, cost_ref: Optional[list[int]] = None):
+    def __init__(self, cost_ref: Optional[list[int]] = None, sink: Optional[list[str]] = None):
         self._env: dict[str, RuntimeValue] = {}
         self._functions: dict[str, FunctionDeclaration] = {}
-        # use a one-element list so that copies share the same counter object
+        self._owned: set[str] = set()
+        # use a one-element list so that frames share the same counter object
         self._cost_ref: list[int] = cost_ref if cost_ref is not None else [0]
+        self._sink = sink
 
     # ---------------------------------------------------------------------
     # cost utilities
@@ -76,6 +88,16 @@ class Environment:
     def get_cost_ref(self) -> list[int]:
         return self._cost_ref
     
+    # ---------------------------------------------------------------------
+    # program output
+    # ---------------------------------------------------------------------
+    def emit(self, line: str) -> None:
+        """Write one line of program output to the sink, or stdout if unset."""
+        if self._sink is None:
+            print(line)
+        else:
+            self._sink.append(line)
+
     def get_functions(self) -> dict[str, FunctionDeclaration]:
         return self._functions
     
@@ -83,26 +105,33 @@ class Environment:
         self._functions = functions.copy()
 
     # ---------------------------------------------------------------------
-    # binding manipulation – each returns a *new* Environment that shares the
-    # same cost counter.
+    # call frames
     # ---------------------------------------------------------------------
-    def _clone(self) -> "Environment":
-        new_env = Environment(self._cost_ref)
-        new_env._env = self._env.copy()
-        new_env._functions = self._functions.copy()
-        return new_env
+    def new_frame(self) -> "Environment":
+        """Create an empty frame for a function call.
 
+        The frame shares the cost counter and the function table; the table
+        is copied on write by `add_function`, so declarations made inside a
+        call never leak back into the caller.
+        """
+        frame = Environment(self._cost_ref, self._sink)
+        frame._functions = self._functions
+        return frame
+
+    # ---------------------------------------------------------------------
+    # binding manipulation – each updates this frame in place and returns it.
+    # ---------------------------------------------------------------------
     def add(self, name: str, value: RuntimeValue) -> "Environment":
-        new_env = self._clone()
-        new_env._env[name] = value
-        return new_env
+        self._env[name] = value
+        self._owned.discard(name)
+        return self
 
     def set(self, name: str, value: RuntimeValue) -> "Environment":
         if name not in self._env:
             raise KeyError(f"Variable not found: {name}")
-        new_env = self._clone()
-        new_env._env[name] = value
-        return new_env
+        self._env[name] = value
+        self._owned.discard(name)
+        return self
 
     def set_list_element(self, name: str, index: int, value: RuntimeValue) -> "Environment":
         if name not in self._env:
@@ -113,21 +142,22 @@ class Environment:
         if index < 0 or index >= len(current_value):
             raise EvaluationError(
                 f"List index {index} out of bounds (list length: {len(current_value)})")
-        new_list = current_value.copy()
         if not isinstance(value, (int, bool, float)):
             raise EvaluationError(f"Cannot assign list to list element")
-        new_list[index] = value
-        new_env = self._clone()
-        new_env._env[name] = new_list
-        return new_env
+        if name not in self._owned:
+            # first write since binding: other bindings may share this object
+            current_value = current_value.copy()
+            self._env[name] = current_value
+            self._owned.add(name)
+        current_value[index] = value
+        return self
 
     # ------------------------------------------------------------------
     # function handling
     # ------------------------------------------------------------------
     def add_function(self, name: str, func_decl: FunctionDeclaration) -> "Environment":
-        new_env = self._clone()
-        new_env._functions[name] = func_decl
-        return new_env
+        self._functions = {**self._functions, name: func_decl}
+        return self
 
     def get_function(self, name: str) -> FunctionDeclaration:
         if name not in self._functions:
@@ -141,6 +171,14 @@ class Environment:
     # value lookup helpers
     # ------------------------------------------------------------------
     def find(self, name: str) -> RuntimeValue:
+        if name not in self._env:
+            raise KeyError(f"Variable not found: {name}")
+        # the value may now be bound elsewhere, so the next write must copy
+        self._owned.discard(name)
+        return self._env[name]
+
+    def peek(self, name: str) -> RuntimeValue:
+        """Look up a value that is only inspected, never stored elsewhere."""
         if name not in self._env:
             raise KeyError(f"Variable not found: {name}")
         return self._env[name]
@@ -155,161 +193,198 @@ class Environment:
 
 # ---------------------------------------------------------------------------
 # Expression evaluation with cost tracking
+#
+# Each expression node type has its own handler; `evaluate_expression` picks
+# the handler with a single dict lookup on the node's class instead of trying
+# every `case` of a `match` statement in turn.
 # ---------------------------------------------------------------------------
 
-def evaluate_expression(env: Environment, expr: Expression) -> RuntimeValue:  
-    def eval_expr(e: Expression) -> RuntimeValue:  # local helper so we can recurse
-        match e:
-            # literals – no cost for just reading a constant
-            case IntegerLiteral(value=val):
-                return val
-            case BooleanLiteral(value=val):
-                return val
-            case FloatLiteral(value=val):
-                return val
-
-            # variable access
-            case Variable(name=name):
-                env.increment_cost()
-                try:
-                    return env.find(name)
-                except KeyError:
-                    raise EvaluationError(f"Undefined variable: {name}")
-
-            # unary op – only NOT exists so far
-            case UnaryExpression(operator=operator, operand=operand):
-                operand_val = eval_expr(operand)
-                env.increment_cost()
-                match operator:
-                    case UnaryOperator.NOT:
-                        return not operand_val
-                    case _:
-                        raise EvaluationError(f"Unknown unary operator: {operator}")
-
-            # binary op
-            case BinaryExpression(left=left_expr, operator=operator, right=right_expr):
-                left = eval_expr(left_expr)
-                # short-circuit for AND / OR: only eval right if needed
-                match operator:
-                    case BinaryOperator.AND:
-                        if not left:
-                            env.increment_cost()
-                            return False
-                        right = eval_expr(right_expr)
-                        env.increment_cost()
-                        return left and right
-                    case BinaryOperator.OR:
-                        if left:
-                            env.increment_cost()
-                            return True
-                        right = eval_expr(right_expr)
-                        env.increment_cost()
-                        return left or right
-                    case _:
-                        # normal case: evaluate both sides unconditionally
-                        right = eval_expr(right_expr)
-                        env.increment_cost()
-                        match operator:
-                            case BinaryOperator.ADDITION:
-                                left_num = ensure_numeric(left)
-                                right_num = ensure_numeric(right)
-                                return left_num + right_num
-                            case BinaryOperator.SUBTRACTION:
-                                left_num = ensure_numeric(left)
-                                right_num = ensure_numeric(right)
-                                return left_num - right_num
-                            case BinaryOperator.MULTIPLICATION:
-                                left_num = ensure_numeric(left)
-                                right_num = ensure_numeric(right)
-                                return left_num * right_num
-                            case BinaryOperator.DIVISION:
-                                left_num = ensure_numeric(left)
-                                right_num = ensure_numeric(right)
-                                if right_num == 0:
-                                    raise EvaluationError("Division by zero")
-                                return left_num / right_num if isinstance(left_num, float) or isinstance(right_num, float) else left_num // right_num
-                            case BinaryOperator.MODULUS:
-                                left_num = ensure_numeric(left)
-                                right_num = ensure_numeric(right)
-                                if right_num == 0:
-                                    raise EvaluationError("Modulus by zero")
-                                return left_num % right_num
-                            case BinaryOperator.LESS_THAN:
-                                left_num = ensure_numeric(left)
-                                right_num = ensure_numeric(right)
-                                return left_num < right_num
-                            case BinaryOperator.GREATER_THAN:
-                                left_num = ensure_numeric(left)
-                                right_num = ensure_numeric(right)
-                                return left_num > right_num
-                            case BinaryOperator.LESS_THAN_OR_EQUAL:
-                                left_num = ensure_numeric(left)
-                                right_num = ensure_numeric(right)
-                                return left_num <= right_num
-                            case BinaryOperator.GREATER_THAN_OR_EQUAL:
-                                left_num = ensure_numeric(left)
-                                right_num = ensure_numeric(right)
-                                return left_num >= right_num
-                            case BinaryOperator.IDENTICAL_TO:
-                                return left == right
-                            case BinaryOperator.NOT_EQUAL:
-                                return left != right
-                            case _:
-                                raise EvaluationError(f"Unknown binary operator: {operator}")
-
-            # function call
-            case FunctionCall():
-                return evaluate_function_call(env, e)
-
-            # list literal – treat construction as 1 cost (plus cost of each element eval inside recursion)
-            case ListLiteral(elements=elements):
-                env.increment_cost()
-                result: list[int | bool | float] = []
-                for el in elements:
-                    el_val = eval_expr(el)
-                    if not isinstance(el_val, (int, bool, float)):
-                        raise EvaluationError(f"List elements must be int, bool, or float, got {type(el_val).__name__}")
-                    result.append(el_val)
-                return result
-
-            # list access
-            case ListAccess(list_expr=list_expr, index=index):
-                list_val = eval_expr(list_expr)
-                idx_val = eval_expr(index)
-                if not isinstance(list_val, list):
-                    raise EvaluationError("Cannot index into non-list value")
-                if not isinstance(idx_val, int):
-                    raise EvaluationError("List index must be integer")
-                if idx_val < 0 or idx_val >= len(list_val):
-                    raise EvaluationError(
-                        f"List index {idx_val} out of bounds (length {len(list_val)})")
-                env.increment_cost()
-                return list_val[idx_val]
-
-            # repeat(value, n)
-            case RepeatCall(value=value, count=count):
-                repeat_val: RuntimeValue = eval_expr(value)
-                count_val = eval_expr(count)
-                if not isinstance(count_val, int):
-                    raise EvaluationError("Repeat count must be integer")
-                if count_val < 0:
-                    raise EvaluationError("Repeat count cannot be negative")
-                if not isinstance(repeat_val, (int, bool, float)):
-                    raise EvaluationError(f"Repeat value must be int, bool, or float, got {type(repeat_val).__name__}")
-                env.increment_cost()
-                return [repeat_val] * count_val
-
-            # len(list)
-            case LenCall(list_expr=list_expr):
-                list_val = eval_expr(list_expr)
-                list_val_checked = ensure_list(list_val)
-                env.increment_cost()
-                return len(list_val_checked)
-
-            case _:
-                raise EvaluationError(f"Unknown expression type: {type(e)}")
-
-    return eval_expr(expr)
+# literals – no cost for just reading a constant
+def _eval_integer_literal(env: Environment, e: IntegerLiteral) -> RuntimeValue:
+    return e.value
+
+
+def _eval_boolean_literal(env: Environment, e: BooleanLiteral) -> RuntimeValue:
+    return e.value
+
+
+def _eval_float_literal(env: Environment, e: FloatLiteral) -> RuntimeValue:
+    return e.value
+
+
+# variable access
+def _eval_variable(env: Environment, e: Variable) -> RuntimeValue:
+    env.increment_cost()
+    try:
+        return env.find(e.name)
+    except KeyError:
+        raise EvaluationError(f"Undefined variable: {e.name}")
+
+
+# unary op – only NOT exists so far
+def _eval_unary_expression(env: Environment, e: UnaryExpression) -> RuntimeValue:
+    operand_val = evaluate_expression(env, e.operand)
+    env.increment_cost()
+    match e.operator:
+        case UnaryOperator.NOT:
+            return not operand_val
+        case _:
+            raise EvaluationError(f"Unknown unary operator: {e.operator}")
+
+
+def _divide(left: int | float, right: int | float) -> int | float:
+    if right == 0:
+        raise EvaluationError("Division by zero")
+    return left / right if isinstance(left, float) or isinstance(right, float) else left // right
+
+
+def _modulus(left: int | float, right: int | float) -> int | float:
+    if right == 0:
+        raise EvaluationError("Modulus by zero")
+    return left % right
+
+
+# operators whose operands must both be numbers
+_NUMERIC_OPERATORS: dict[BinaryOperator, Callable[[int | float, int | float], RuntimeValue]] = {
+    BinaryOperator.ADDITION: add,
+    BinaryOperator.SUBTRACTION: sub,
+    BinaryOperator.MULTIPLICATION: mul,
+    BinaryOperator.DIVISION: _divide,
+    BinaryOperator.MODULUS: _modulus,
+    BinaryOperator.LESS_THAN: lt,
+    BinaryOperator.GREATER_THAN: gt,
+    BinaryOperator.LESS_THAN_OR_EQUAL: le,
+    BinaryOperator.GREATER_THAN_OR_EQUAL: ge,
+}
+
+# operators that accept any pair of values
+_EQUALITY_OPERATORS: dict[BinaryOperator, Callable[[RuntimeValue, RuntimeValue], RuntimeValue]] = {
+    BinaryOperator.IDENTICAL_TO: eq,
+    BinaryOperator.NOT_EQUAL: ne,
+}
+
+
+# binary op
+def _eval_binary_expression(env: Environment, e: BinaryExpression) -> RuntimeValue:
+    operator = e.operator
+    left = evaluate_expression(env, e.left)
+    # short-circuit for AND / OR: only eval right if needed
+    if operator is BinaryOperator.AND:
+        if not left:
+            env.increment_cost()
+            return False
+        right = evaluate_expression(env, e.right)
+        env.increment_cost()
+        return left and right
+    if operator is BinaryOperator.OR:
+        if left:
+            env.increment_cost()
+            return True
+        right = evaluate_expression(env, e.right)
+        env.increment_cost()
+        return left or right
+
+    # normal case: evaluate both sides unconditionally
+    right = evaluate_expression(env, e.right)
+    env.increment_cost()
+    numeric_op = _NUMERIC_OPERATORS.get(operator)
+    if numeric_op is not None:
+        return numeric_op(ensure_numeric(left), ensure_numeric(right))
+    equality_op = _EQUALITY_OPERATORS.get(operator)
+    if equality_op is not None:
+        return equality_op(left, right)
+    raise EvaluationError(f"Unknown binary operator: {operator}")
+
+
+# function call
+def _eval_function_call(env: Environment, e: FunctionCall) -> RuntimeValue:
+    return evaluate_function_call(env, e)
+
+
+# list literal – treat construction as 1 cost (plus cost of each element eval inside recursion)
+def _eval_list_literal(env: Environment, e: ListLiteral) -> RuntimeValue:
+    env.increment_cost()
+    result: list[int | bool | float] = []
+    for el in e.elements:
+        el_val = evaluate_expression(env, el)
+        if not isinstance(el_val, (int, bool, float)):
+            raise EvaluationError(f"List elements must be int, bool, or float, got {type(el_val).__name__}")
+        result.append(el_val)
+    return result
+
+
+def _eval_list_operand(env: Environment, e: Expression) -> RuntimeValue:
+    """Evaluate the list that a subscript or `len()` reads from.
+
+    Same cost as `_eval_variable`, but a plain variable is only peeked at: the
+    list does not escape, so its frame keeps ownership for in-place writes.
+    """
+    if type(e) is not Variable:
+        return evaluate_expression(env, e)
+    env.increment_cost()
+    try:
+        return env.peek(e.name)
+    except KeyError:
+        raise EvaluationError(f"Undefined variable: {e.name}")
+
+
+# list access
+def _eval_list_access(env: Environment, e: ListAccess) -> RuntimeValue:
+    list_val = _eval_list_operand(env, e.list_expr)
+    idx_val = evaluate_expression(env, e.index)
+    if not isinstance(list_val, list):
+        raise EvaluationError("Cannot index into non-list value")
+    if not isinstance(idx_val, int):
+        raise EvaluationError("List index must be integer")
+    if idx_val < 0 or idx_val >= len(list_val):
+        raise EvaluationError(
+            f"List index {idx_val} out of bounds (length {len(list_val)})")
+    env.increment_cost()
+    return list_val[idx_val]
+
+
+# repeat(value, n)
+def _eval_repeat_call(env: Environment, e: RepeatCall) -> RuntimeValue:
+    repeat_val = evaluate_expression(env, e.value)
+    count_val = evaluate_expression(env, e.count)
+    if not isinstance(count_val, int):
+        raise EvaluationError("Repeat count must be integer")
+    if count_val < 0:
+        raise EvaluationError("Repeat count cannot be negative")
+    if not isinstance(repeat_val, (int, bool, float)):
+        raise EvaluationError(f"Repeat value must be int, bool, or float, got {type(repeat_val).__name__}")
+    env.increment_cost()
+    return [repeat_val] * count_val
+
+
+# len(list)
+def _eval_len_call(env: Environment, e: LenCall) -> RuntimeValue:
+    list_val = _eval_list_operand(env, e.list_expr)
+    list_val_checked = ensure_list(list_val)
+    env.increment_cost()
+    return len(list_val_checked)
+
+
+_EXPRESSION_HANDLERS: dict[type, Callable[[Environment, Any], RuntimeValue]] = {
+    IntegerLiteral: _eval_integer_literal,
+    BooleanLiteral: _eval_boolean_literal,
+    FloatLiteral: _eval_float_literal,
+    Variable: _eval_variable,
+    UnaryExpression: _eval_unary_expression,
+    BinaryExpression: _eval_binary_expression,
+    FunctionCall: _eval_function_call,
+    ListLiteral: _eval_list_literal,
+    ListAccess: _eval_list_access,
+    RepeatCall: _eval_repeat_call,
+    LenCall: _eval_len_call,
+}
+
+
+def evaluate_expression(env: Environment, expr: Expression) -> RuntimeValue:
+    handler = _EXPRESSION_HANDLERS.get(type(expr))
+    if handler is None:
+        raise EvaluationError(f"Unknown expression type: {type(expr)}")
+    return handler(env, expr)
 
 
 # ---------------------------------------------------------------------------
@@ -332,16 +407,17 @@ def evaluate_function_call(env: Environment, call: FunctionCall) -> RuntimeValue
     # count the *call* itself
     env.increment_cost()
 
-    # create function-local environment (shares cost counter) and bind params
-    func_env = Environment(env.get_cost_ref())
-    # Copy all function declarations to maintain access to other functions
-    func_env.set_functions(env.get_functions())
+    # push a fresh call frame (shares cost counter and functions) and bind params
+    func_env = env.new_frame()
     for param, arg_val in zip(func_decl.parameters, arg_vals):
-        func_env = func_env.add(param.name, arg_val)
+        func_env.add(param.name, arg_val)
 
-    # execute body
+    # execute body; a return at the top level of the body is handled inline,
+    # only returns nested in if/while bodies need to unwind via the exception
     try:
         for stmt in func_decl.body:
+            if type(stmt) is Return:
+                return evaluate_expression(func_env, stmt.expression)
             func_env, _ = execute_statement(func_env, stmt)
         raise EvaluationError(f"Function '{call.name}' did not return a value")
     except ReturnException as ret:
@@ -350,119 +426,172 @@ def evaluate_function_call(env: Environment, call: FunctionCall) -> RuntimeValue
 
 # ---------------------------------------------------------------------------
 # Statement execution (cost tracked where appropriate)
+#
+# Dispatched the same way as expressions: one handler per statement class.
 # ---------------------------------------------------------------------------
 
-def execute_statement(env: Environment, stmt: Statement) -> tuple[Environment, Optional[RuntimeValue | list[RuntimeValue]]]:
-    match stmt:
-        # let binding
-        case Let(name=name, expression=expression):
-            if env.mem(name):
-                raise EvaluationError(f"Variable already bound: {name}")
-            value = evaluate_expression(env, expression)
-            env = env.add(name, value)
-            env.increment_cost()  # write cost
-            return env, None
-
-        # print
-        case Print(expression=expression):
-            value = evaluate_expression(env, expression)
-            env.increment_cost()  # I/O cost (optional; remove if undesired)
-            if isinstance(value, bool):
-                print("true" if value else "false")
-            elif isinstance(value, list):
-                list_str = "[" + ", ".join(
-                    str(el if not isinstance(el, bool) else ("true" if el else "false")) for el in value
-                ) + "]"
-                print(list_str)
-            else:
-                print(value)
-            return env, value
-
-        # set variable
-        case Set(name=name, expression=expression):
-            if not env.mem(name):
-                raise EvaluationError(f"Cannot set undefined variable: {name}")
-            value = evaluate_expression(env, expression)
-            env = env.set(name, value)
-            env.increment_cost()
-            return env, None
-
-        # list[index] = value
-        case ListAssignment(list_name=list_name, index=index, value=value_expr):
-            if not env.mem(list_name):
-                raise EvaluationError(f"Cannot set undefined variable: {list_name}")
-            idx_val = evaluate_expression(env, index)
-            if not isinstance(idx_val, int):
-                raise EvaluationError("List index must be integer")
-            elem_val = evaluate_expression(env, value_expr)
-            env = env.set_list_element(list_name, idx_val, elem_val)
-            env.increment_cost()
-            return env, None
-
-        # if
-        case If(condition=condition, body=body):
-            cond = evaluate_expression(env, condition)
-            if not isinstance(cond, bool):
-                raise EvaluationError("If condition must be boolean")
-            env.increment_cost()  # condition test
-            if cond:
-                cur = env
-                if_results: list[RuntimeValue] = []
-                for body_stmt in body:
-                    cur, r = execute_statement(cur, body_stmt)
-                    if isinstance(r, list):
-                        if_results.extend(r)
-                    elif r is not None:
-                        if_results.append(r)
-                return cur, if_results if if_results else None
-            return env, None
-
-        # while
-        case While(condition=condition, body=body):
-            cur = env
-            while_results: list[RuntimeValue] = []
-            while True:
-                cond_val = evaluate_expression(cur, condition)
-                if not isinstance(cond_val, bool):
-                    raise EvaluationError("While condition must be boolean")
-                cur.increment_cost()  # condition test each iteration
-                if not cond_val:
-                    break
-                for body_stmt in body:
-                    cur, r = execute_statement(cur, body_stmt)
-                    if isinstance(r, list):
-                        while_results.extend(r)
-                    elif r is not None:
-                        while_results.append(r)
-            return cur, while_results if while_results else None
-
-        # comment – no cost
-        case Comment():
-            return env, None
-
-        # function declaration – no cost (compile-time)
-        case FunctionDeclaration(name=name):
-            if env.has_function(name):
-                raise EvaluationError(f"Function already declared: {name}")
-            env = env.add_function(name, stmt)
-            return env, None
-
-        # return
-        case Return(expression=expression):
-            val = evaluate_expression(env, expression)
-            raise ReturnException(val)
-
-        case _:
-            raise EvaluationError(f"Unknown statement type: {type(stmt)}")
+StatementResult = tuple[Environment, Optional[RuntimeValue | list[RuntimeValue]]]
+
+
+# let binding
+def _exec_let(env: Environment, stmt: Let) -> StatementResult:
+    name = stmt.name
+    if env.mem(name):
+        raise EvaluationError(f"Variable already bound: {name}")
+    value = evaluate_expression(env, stmt.expression)
+    env = env.add(name, value)
+    env.increment_cost()  # write cost
+    return env, None
+
+
+def format_value(value: RuntimeValue) -> str:
+    """Render a runtime value the way `print` displays it."""
+    if type(value) is bool:
+        return "true" if value else "false"
+    elif type(value) is list:
+        # execute() also runs ASTs that never went through the type checker,
+        # so each element is formatted on its own.
+        return "[" + ", ".join(
+            ["true" if el is True else "false" if el is False else str(el) for el in value]
+        ) + "]"
+    else:
+        return str(value)
+
+
+# print
+def _exec_print(env: Environment, stmt: Print) -> StatementResult:
+    value = evaluate_expression(env, stmt.expression)
+    env.increment_cost()  # I/O cost (optional; remove if undesired)
+    env.emit(format_value(value))
+    return env, value
+
+
+# set variable
+def _exec_set(env: Environment, stmt: Set) -> StatementResult:
+    name = stmt.name
+    if not env.mem(name):
+        raise EvaluationError(f"Cannot set undefined variable: {name}")
+    value = evaluate_expression(env, stmt.expression)
+    env = env.set(name, value)
+    env.increment_cost()
+    return env, None
+
+
+# list[index] = value
+def _exec_list_assignment(env: Environment, stmt: ListAssignment) -> StatementResult:
+    list_name = stmt.list_name
+    if not env.mem(list_name):
+        raise EvaluationError(f"Cannot set undefined variable: {list_name}")
+    idx_val = evaluate_expression(env, stmt.index)
+    if not isinstance(idx_val, int):
+        raise EvaluationError("List index must be integer")
+    elem_val = evaluate_expression(env, stmt.value)
+    env = env.set_list_element(list_name, idx_val, elem_val)
+    env.increment_cost()
+    return env, None
+
+
+# if
+def _exec_if(env: Environment, stmt: If) -> StatementResult:
+    cond = evaluate_expression(env, stmt.condition)
+    if not isinstance(cond, bool):
+        raise EvaluationError("If condition must be boolean")
+    env.increment_cost()  # condition test
+    if cond:
+        cur = env
+        if_results: list[RuntimeValue] = []
+        for body_stmt in stmt.body:
+            cur, r = execute_statement(cur, body_stmt)
+            if isinstance(r, list):
+                if_results.extend(r)
+            elif r is not None:
+                if_results.append(r)
+        return cur, if_results if if_results else None
+    return env, None
+
+
+# while
+def _exec_while(env: Environment, stmt: While) -> StatementResult:
+    """Run a while loop.
+
+    This is the interpreter's hottest path, so everything the loop touches on
+    each iteration is bound to a local up front and the condition cost is
+    added straight to the shared counter.
+    """
+    condition = stmt.condition
+    body = stmt.body
+    evaluate = evaluate_expression
+    execute_stmt = execute_statement
+    cost_ref = env.get_cost_ref()
+    cur = env
+    while_results: list[RuntimeValue] = []
+    append = while_results.append
+    extend = while_results.extend
+    while True:
+        cond_val = evaluate(cur, condition)
+        if not isinstance(cond_val, bool):
+            raise EvaluationError("While condition must be boolean")
+        cost_ref[0] += 1  # condition test each iteration
+        if not cond_val:
+            break
+        for body_stmt in body:
+            cur, r = execute_stmt(cur, body_stmt)
+            if isinstance(r, list):
+                extend(r)
+            elif r is not None:
+                append(r)
+    return cur, while_results if while_results else None
+
+
+# comment – no cost
+def _exec_comment(env: Environment, stmt: Comment) -> StatementResult:
+    return env, None
+
+
+# function declaration – no cost (compile-time)
+def _exec_function_declaration(env: Environment, stmt: FunctionDeclaration) -> StatementResult:
+    if env.has_function(stmt.name):
+        raise EvaluationError(f"Function already declared: {stmt.name}")
+    env = env.add_function(stmt.name, stmt)
+    return env, None
+
+
+# return
+def _exec_return(env: Environment, stmt: Return) -> StatementResult:
+    val = evaluate_expression(env, stmt.expression)
+    raise ReturnException(val)
+
+
+_STATEMENT_HANDLERS: dict[type, Callable[[Environment, Any], StatementResult]] = {
+    Let: _exec_let,
+    Print: _exec_print,
+    Set: _exec_set,
+    ListAssignment: _exec_list_assignment,
+    If: _exec_if,
+    While: _exec_while,
+    Comment: _exec_comment,
+    FunctionDeclaration: _exec_function_declaration,
+    Return: _exec_return,
+}
+
+
+def execute_statement(env: Environment, stmt: Statement) -> StatementResult:
+    handler = _STATEMENT_HANDLERS.get(type(stmt))
+    if handler is None:
+        raise EvaluationError(f"Unknown statement type: {type(stmt)}")
+    return handler(env, stmt)
 
 
 # ---------------------------------------------------------------------------
 # Program entry point
 # ---------------------------------------------------------------------------
 
-def execute(ast: AbstractSyntaxTree) -> tuple[Sequence[RuntimeValue], int]:
-    """Execute a whole programme and return (print_results, total_cost)."""
-    env = Environment.empty()
+def execute(ast: AbstractSyntaxTree, sink: Optional[list[str]] = None) -> tuple[Sequence[RuntimeValue], int]:
+    """Execute a whole programme and return (print_results, total_cost).
+
+    Printed lines are written to stdout, or appended to `sink` when given.
+    """
+    env = Environment(sink=sink)
     results: list[RuntimeValue] = []
 
     def collect(stmt_res: Optional[RuntimeValue | list[RuntimeValue]]) -> None:
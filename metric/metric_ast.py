@@ -13,7 +13,7 @@ class Type(Enum):
     FLOAT = "Float"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ListType:
     element_type: Type
 
@@ -38,7 +38,7 @@ class UnaryOperator(Enum):
     NOT = "Not"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IntegerLiteral:
     value: int
     
@@ -46,7 +46,7 @@ class IntegerLiteral:
         return visitor.visit_integer_literal(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Variable:
     name: str
     
@@ -54,7 +54,7 @@ class Variable:
         return visitor.visit_variable(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BooleanLiteral:
     value: bool
     
@@ -62,7 +62,7 @@ class BooleanLiteral:
         return visitor.visit_boolean_literal(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FloatLiteral:
     value: float
     
@@ -70,7 +70,7 @@ class FloatLiteral:
         return visitor.visit_float_literal(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BinaryExpression:
     left: Expression
     operator: BinaryOperator
@@ -80,7 +80,7 @@ class BinaryExpression:
         return visitor.visit_binary_op(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UnaryExpression:
     operator: UnaryOperator
     operand: Expression
@@ -89,7 +89,7 @@ class UnaryExpression:
         return visitor.visit_unary_op(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FunctionCall:
     name: str
     arguments: list[Expression]
@@ -98,7 +98,7 @@ class FunctionCall:
         return visitor.visit_function_call(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ListLiteral:
     elements: list[Expression]
     
@@ -106,7 +106,7 @@ class ListLiteral:
         return visitor.visit_list_literal(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ListAccess:
     list_expr: Expression
     index: Expression
@@ -115,7 +115,7 @@ class ListAccess:
         return visitor.visit_list_access(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RepeatCall:
     value: Expression
     count: Expression
@@ -124,7 +124,7 @@ class RepeatCall:
         return visitor.visit_repeat_call(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LenCall:
     list_expr: Expression
     
@@ -135,7 +135,7 @@ class LenCall:
 Expression = IntegerLiteral | Variable | BooleanLiteral | FloatLiteral | BinaryExpression | UnaryExpression | FunctionCall | ListLiteral | ListAccess | RepeatCall | LenCall
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Let:
     name: str
     type_annotation: Type | ListType
@@ -145,7 +145,7 @@ class Let:
         return visitor.visit_let(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Print:
     expression: Expression
     
@@ -153,7 +153,7 @@ class Print:
         return visitor.visit_print(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class If:
     condition: Expression
     body: list[Statement]
@@ -162,7 +162,7 @@ class If:
         return visitor.visit_if(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class While:
     condition: Expression
     body: list[Statement]
@@ -171,7 +171,7 @@ class While:
         return visitor.visit_while(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Set:
     name: str
     expression: Expression
@@ -180,7 +180,7 @@ class Set:
         return visitor.visit_set(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ListAssignment:
     list_name: str
     index: Expression
@@ -190,7 +190,7 @@ class ListAssignment:
         return visitor.visit_list_assignment(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Comment:
     pass
     
@@ -198,13 +198,13 @@ class Comment:
         return visitor.visit_comment(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Parameter:
     name: str
     type_annotation: Type | ListType
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FunctionDeclaration:
     name: str
     parameters: list[Parameter]
@@ -215,7 +215,7 @@ class FunctionDeclaration:
         return visitor.visit_function_declaration(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Return:
     expression: Expression
     
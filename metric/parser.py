@@ -1,4 +1,5 @@
 from __future__ import annotations
+from functools import lru_cache
 from typing import Callable
 from .metric_ast import *
 from .tokenizer import Token, IntegerToken, IdentifierToken, FloatToken, TokenType
@@ -8,6 +9,19 @@ class ParseError(Exception):
     pass
 
 
+# Literal nodes are immutable, so small integers and booleans are shared
+# rather than allocated afresh at every occurrence.
+_SMALL_INTEGER_LITERALS = {n: IntegerLiteral(n) for n in range(257)}
+_TRUE_LITERAL = BooleanLiteral(True)
+_FALSE_LITERAL = BooleanLiteral(False)
+
+
+@lru_cache(maxsize=1024)
+def _variable(name: str) -> Variable:
+    """Return a shared Variable node for `name`."""
+    return Variable(name)
+
+
 def parse_binary_rest(left_expr: Expression, tokens: list[TokenType], operators: dict[Token, BinaryOperator], next_level_parser: Callable[[list[TokenType]], tuple[Expression, list[TokenType]]]) -> tuple[Expression, list[TokenType]]:
     """Generic helper for left-associative binary operators."""
     while tokens and isinstance(tokens[0], Token) and tokens[0] in operators:
@@ -26,7 +40,9 @@ def parse_factor(tokens: list[TokenType]) -> tuple[Expression, list[TokenType]]:
         raise ParseError("Expected integer, float, identifier, boolean, or opening parenthesis")
     
     if isinstance(tokens[0], IntegerToken):
-        return IntegerLiteral(tokens[0].value), tokens[1:]
+        value = tokens[0].value
+        literal = _SMALL_INTEGER_LITERALS.get(value)
+        return (literal if literal is not None else IntegerLiteral(value)), tokens[1:]
     elif isinstance(tokens[0], FloatToken):
         return FloatLiteral(tokens[0].value), tokens[1:]
     elif isinstance(tokens[0], IdentifierToken):
@@ -69,14 +85,14 @@ def parse_factor(tokens: list[TokenType]) -> tuple[Expression, list[TokenType]]:
                 raise ParseError("Expected ']' after list index")
             remaining = remaining[1:]
             
-            return ListAccess(Variable(identifier_name), index_expr), remaining
+            return ListAccess(_variable(identifier_name), index_expr), remaining
         else:
             # Regular variable reference
-            return Variable(identifier_name), remaining
+            return _variable(identifier_name), remaining
     elif tokens[0] == Token.TRUE:
-        return BooleanLiteral(True), tokens[1:]
+        return _TRUE_LITERAL, tokens[1:]
     elif tokens[0] == Token.FALSE:
-        return BooleanLiteral(False), tokens[1:]
+        return _FALSE_LITERAL, tokens[1:]
     elif tokens[0] == Token.LEFT_PARENTHESIS:
         expr, remaining = parse_expression(tokens[1:])
         if not remaining or remaining[0] != Token.RIGHT_PARENTHESIS:
@@ -261,7 +277,16 @@ def _parse_let_statement(tokens: list[TokenType]) -> tuple[Statement, list[Token
         raise ParseError("Expected 'let identifier type = expression'")
     
     name = tokens[1].name
-    
+
+    # Fast path for the common `let name type = <integer>` form: a lone literal
+    # ending the statement needs no trip through the expression grammar. List
+    # types go through _parse_type so they keep its error messages.
+    if (tokens[2] in (Token.INTEGER_TYPE, Token.BOOLEAN_TYPE, Token.FLOAT_TYPE)
+            and tokens[3] == Token.ASSIGN and isinstance(tokens[4], IntegerToken)
+            and (len(tokens) == 5 or tokens[5] == Token.STATEMENT_SEPARATOR)):
+        literal, remaining = parse_factor(tokens[4:])
+        return Let(name, _parse_type_annotation(tokens[2]), literal), remaining
+
     # Parse type (could be list type)
     type_annotation, remaining_after_type = _parse_type(tokens[2:])
     
@@ -6,10 +6,28 @@ post-tokenization, using both the original source code and tokenized output
 to enforce strict formatting rules.
 """
 
+import re
+
 from metric.errors import StyleError
 from .tokenizer import Token, IntegerToken, FloatToken, IdentifierToken
 
 
+# Words that begin a statement; two on one line means two statements.
+_STATEMENT_KEYWORDS = frozenset({"let", "print", "if", "while", "set", "def", "return"})
+
+# Characters that must be preceded by a space when they follow a word.
+_OPERATOR_CHARACTERS = frozenset("+-*/%=<>!")
+
+# A run of spaces that reaches the end of its line.
+_TRAILING_SPACES = re.compile(r' +$', re.MULTILINE)
+
+# Indentation that is not a multiple of 4 spaces. At the start of a line it
+# takes as many whole 4-space groups as it can, then 1-3 more spaces that are
+# not followed by another space. Group 1 is that leftover run, so its start is
+# the first bad column. For example, 6 leading spaces match as 4 + 2, while
+# 8 never match.
+_BAD_INDENTATION = re.compile(r'^(?:    )*( {1,3})(?! )', re.MULTILINE)
+
 
 def validate_style(source_code: str, tokens: list[Token | IntegerToken | FloatToken | IdentifierToken]) -> None:
     """
@@ -45,32 +63,27 @@ def validate_style(source_code: str, tokens: list[Token | IntegerToken | FloatTo
 
 def _validate_not_empty(text: str) -> None:
     """Ensure program is not empty"""
-    if not text.strip():
+    if not text or text.isspace():
         raise StyleError("Program must not be empty", line=1, column=1)
 
 
 def _validate_line_endings(text: str) -> None:
     """Ensure text contains no carriage return characters."""
-    for position, character in enumerate(text):
-        if character != '\r':
-            continue
+    position = text.find('\r')
+    if position == -1:
+        return
 
-        # Compute the line number (1-based)
-        text_before = text[:position]
-        line_number = text_before.count('\n') + 1
+    # Compute the line number (1-based)
+    line_number = text.count('\n', 0, position) + 1
 
-        # Compute the column number (1-based)
-        last_newline_index = text_before.rfind('\n')
-        if last_newline_index != -1:
-            column_number = position - last_newline_index
-        else:
-            column_number = position + 1
+    # Compute the column number (1-based); rfind gives -1 on the first line
+    column_number = position - text.rfind('\n', 0, position)
 
-        raise StyleError(
-            f"Carriage return newlines not allowed; use \\n only",
-            line=line_number,
-            column=column_number
-        )
+    raise StyleError(
+        f"Carriage return newlines not allowed; use \\n only",
+        line=line_number,
+        column=column_number
+    )
 
 
 
@@ -93,60 +106,53 @@ def _validate_leading_trailing_newlines(input_str: str) -> None:
 
 def _validate_newlines(input_str: str) -> None:
     """Check for too many consecutive newlines (max 2 allowed)."""
-    if not input_str:
+    position = input_str.find('\n\n\n')
+    if position == -1:
         return
-    
-    # Count consecutive newlines by looking at the actual newline characters
-    consecutive_newlines = 0
-    i = 0
-    line_num = 1
-    
-    while i < len(input_str):
-        if input_str[i] == '\n':
-            consecutive_newlines += 1
-            if consecutive_newlines > 2:
-                # Report error at the current line number (where the 3rd newline is)
-                raise StyleError(f"Too many consecutive newlines: maximum 2 allowed", line=line_num, column=1)
-            line_num += 1
 
-        else:
-            consecutive_newlines = 0
-        i += 1
+    # Report error at the line where the 3rd newline is
+    line_num = input_str.count('\n', 0, position) + 3
+    raise StyleError(f"Too many consecutive newlines: maximum 2 allowed", line=line_num, column=1)
 
 
 def _validate_line_whitespace(input_str: str) -> None:
     """Enforce two rules:
        1. No trailing spaces.
        2. Indentation must be multiples of 4 spaces (if any spaces are used).
-    """
-    for line_num, line in enumerate(input_str.split('\n'), 1):
 
-        # ---------- rule 1: trailing spaces ---------------------------------
-        if line and line[-1] == ' ':                    # at least one trailing space
-            column = len(line.rstrip()) + 1            # first trailing space (1-indexed)
+    The first offending line is reported; if it breaks both rules, the
+    trailing-space error wins.
+    """
+    trailing = _TRAILING_SPACES.search(input_str)
+    indent = _BAD_INDENTATION.search(input_str)
+
+    # ---------- rule 1: trailing spaces -------------------------------------
+    if trailing is not None:
+        line_start = input_str.rfind('\n', 0, trailing.start()) + 1
+        # An indentation match begins at its line start, so this keeps the
+        # earlier line and lets trailing spaces win on the same line.
+        if indent is None or line_start <= indent.start():
+            line = input_str[line_start:trailing.end()]
             raise StyleError(
                 "Trailing spaces not allowed",
-                line=line_num,
-                column=column
+                line=input_str.count('\n', 0, line_start) + 1,
+                column=len(line.rstrip()) + 1          # first trailing space (1-indexed)
             )
 
-        # ---------- rule 2: indentation multiple of 4 -----------------------
-        leading_spaces = len(line) - len(line.lstrip(' '))
-        if leading_spaces and leading_spaces % 4 != 0:
-            # first “bad” space is the one after the last full 4-space group
-            first_bad_col = (leading_spaces // 4) * 4 + 1  # 1-indexed
-            raise StyleError(
-                "Indentation must be in multiples of 4 spaces",
-                line=line_num,
-                column=first_bad_col
-            )
+    # ---------- rule 2: indentation multiple of 4 ---------------------------
+    if indent is not None:
+        line_start = indent.start()
+        # first “bad” space is the one after the last full 4-space group
+        raise StyleError(
+            "Indentation must be in multiples of 4 spaces",
+            line=input_str.count('\n', 0, line_start) + 1,
+            column=indent.start(1) - line_start + 1   # 1-indexed
+        )
 
 
 
 def _validate_multiple_statements_per_line(input_str: str) -> None:
     """Raise an error if a line contains more than one statement."""
-    statement_keywords = {"let", "print", "if", "while", "set", "def", "return"}
-
     for line_num, line in enumerate(input_str.split('\n'), 1):
         # Strip comments from the line
         code_part = line.split('#', 1)[0]
@@ -160,7 +166,7 @@ def _validate_multiple_statements_per_line(input_str: str) -> None:
         for word in words:
             # Find the position of this word in the line starting from current_pos
             word_pos = line.find(word, current_pos)
-            if word in statement_keywords:
+            if word in _STATEMENT_KEYWORDS:
                 keyword_count += 1
                 if keyword_count == 2:
                     raise StyleError(
@@ -202,30 +208,23 @@ def _check_multiple_spaces_in_line(line: str, line_num: int) -> None:
     Disallow more than one consecutive space between tokens.
     Leading indentation is ignored (that's handled elsewhere).
     """
-    # Skip indentation
-    i = 0
-    while i < len(line) and line[i] == ' ':
-        i += 1
-
-    # Scan the remainder of the line
-    while i < len(line) - 1:
-        if line[i] == ' ' and line[i + 1] == ' ':
-            # First space of the run is the violation
-            raise StyleError(
-                "Multiple spaces not allowed between tokens",
-                line=line_num,
-                column=i + 1   
-            )
-        i += 1
+    # Skip indentation, then look for a double space in the remainder
+    indentation = len(line) - len(line.lstrip(' '))
+    i = line.find('  ', indentation)
+    if i != -1:
+        # First space of the run is the violation
+        raise StyleError(
+            "Multiple spaces not allowed between tokens",
+            line=line_num,
+            column=i + 1
+        )
 
 
 
 def _check_operator_spacing_in_line(line: str, line_num: int) -> None:
     """Check for proper spacing before operators."""
-    operators = ['+', '-', '*', '/', '%', '=', '<', '>', '!']
-    
     for i, char in enumerate(line):
-        if char in operators and i > 0:
+        if char in _OPERATOR_CHARACTERS and i > 0:
             # Check if previous character is alphanumeric (identifier or number)
             if line[i - 1].isalnum():
                 raise StyleError(f"Expected space before operator '{char}'", line=line_num, column=i+1)
@@ -49,15 +49,15 @@ class Token(Enum):
     NOT = "Not"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class IntegerToken:
     value: int
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FloatToken:
     value: float
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class IdentifierToken:
     name: str
 
@@ -9,10 +9,17 @@ from io import StringIO
 
 from metric.metric_ast import *
 from metric.evaluator import Environment, evaluate_expression, execute_statement, execute, EvaluationError
-from metric.tokenizer import tokenize
-from metric.parser import parse
-from metric.type_checker import type_check
-from test.test_utils import code_block
+from test.test_utils import code_block, compile_cached
+
+
+class _PrintBuffer:
+    """Collects printed lines from `execute(..., sink=...)` without touching stdout."""
+
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+
+    def getvalue(self) -> str:
+        return "".join(line + "\n" for line in self.lines)
 
 
 class TestEvaluator(unittest.TestCase):
@@ -120,7 +127,30 @@ class TestEvaluator(unittest.TestCase):
             _, result = execute_statement(env, stmt)
             self.assertEqual(result, 99)
             self.assertEqual(captured_output.getvalue().strip(), "99")
-    
+
+    def test_execute_print_to_sink(self) -> None:
+        ast = compile_cached("print 1\nprint [true, false]")
+        sink: list[str] = []
+
+        with self.capture_stdout() as captured_output:
+            results = execute(ast, sink=sink)[0]
+
+        self.assertEqual(results, [1, True, False])
+        self.assertEqual(sink, ["1", "[true, false]"])
+        self.assertEqual(captured_output.getvalue(), "")
+
+    def test_execute_print_boolean_and_mixed_lists(self) -> None:
+        # execute() accepts ASTs that were never type checked, so mixed lists must
+        # still format each element by its own type.
+        ast: list[Statement] = [
+            Print(ListLiteral([BooleanLiteral(True), BooleanLiteral(False)])),
+            Print(ListLiteral([BooleanLiteral(True), IntegerLiteral(0), FloatLiteral(2.5)])),
+            Print(ListLiteral([IntegerLiteral(1), BooleanLiteral(True)])),
+        ]
+        sink: list[str] = []
+        execute(ast, sink=sink)
+        self.assertEqual(sink, ["[true, false]", "[true, 0, 2.5]", "[1, true]"])
+
     def test_execute_single_statement(self) -> None:
         ast: list[Statement] = [Let("x", Type.INTEGER, IntegerLiteral(5))]
         results = execute(ast)[0]
@@ -133,10 +163,10 @@ class TestEvaluator(unittest.TestCase):
             Print(BinaryExpression(Variable("x"), BinaryOperator.ADDITION, Variable("y")))
         ]
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [15])
-            self.assertEqual(captured_output.getvalue().strip(), "15")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [15])
+        self.assertEqual(captured_output.getvalue().strip(), "15")
     
     def test_execute_complex_program(self) -> None:
         ast: list[Statement] = [
@@ -147,11 +177,11 @@ class TestEvaluator(unittest.TestCase):
             Print(BinaryExpression(Variable("c"), BinaryOperator.ADDITION, IntegerLiteral(10)))
         ]
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [6, 16])
-            output_lines = captured_output.getvalue().strip().split('\n')
-            self.assertEqual(output_lines, ["6", "16"])
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [6, 16])
+        output_lines = captured_output.getvalue().strip().split('\n')
+        self.assertEqual(output_lines, ["6", "16"])
     
     def test_execute_variable_redefinition_error(self) -> None:
         ast: list[Statement] = [
@@ -431,11 +461,11 @@ class TestEvaluator(unittest.TestCase):
     def test_execute_print_boolean(self) -> None:
         ast: list[Statement] = [Print(BooleanLiteral(True))]
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [True])
-            output_lines = captured_output.getvalue().strip()
-            self.assertEqual(output_lines, "true")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [True])
+        output_lines = captured_output.getvalue().strip()
+        self.assertEqual(output_lines, "true")
     
     def test_execute_boolean_assignment_and_comparison(self) -> None:
         ast: list[Statement] = [
@@ -445,11 +475,11 @@ class TestEvaluator(unittest.TestCase):
             Print(Variable("result"))
         ]
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [True])
-            output_lines = captured_output.getvalue().strip()
-            self.assertEqual(output_lines, "true")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [True])
+        output_lines = captured_output.getvalue().strip()
+        self.assertEqual(output_lines, "true")
     
     def test_execute_mixed_boolean_and_integer_operations(self) -> None:
         ast: list[Statement] = [
@@ -461,30 +491,30 @@ class TestEvaluator(unittest.TestCase):
             Print(Variable("isLarge"))
         ]
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [25, True])
-            output_lines = captured_output.getvalue().strip().split('\n')
-            self.assertEqual(output_lines, ["25", "true"])
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [25, True])
+        output_lines = captured_output.getvalue().strip().split('\n')
+        self.assertEqual(output_lines, ["25", "true"])
     
     # If statement tests
     def test_execute_if_true(self) -> None:
         ast: list[Statement] = [If(BooleanLiteral(True), [Print(IntegerLiteral(42))])]
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [42])
-            output_lines = captured_output.getvalue().strip()
-            self.assertEqual(output_lines, "42")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [42])
+        output_lines = captured_output.getvalue().strip()
+        self.assertEqual(output_lines, "42")
     
     def test_execute_if_false(self) -> None:
         ast: list[Statement] = [If(BooleanLiteral(False), [Print(IntegerLiteral(42))])]
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [])
-            output_lines = captured_output.getvalue().strip()
-            self.assertEqual(output_lines, "")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [])
+        output_lines = captured_output.getvalue().strip()
+        self.assertEqual(output_lines, "")
     
     def test_execute_if_with_comparison(self) -> None:
         ast: list[Statement] = [
@@ -492,11 +522,11 @@ class TestEvaluator(unittest.TestCase):
             If(BinaryExpression(Variable("x"), BinaryOperator.GREATER_THAN, IntegerLiteral(5)), [Print(Variable("x"))])
         ]
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [10])
-            output_lines = captured_output.getvalue().strip()
-            self.assertEqual(output_lines, "10")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [10])
+        output_lines = captured_output.getvalue().strip()
+        self.assertEqual(output_lines, "10")
     
     def test_execute_if_with_multiple_statements(self) -> None:
         ast: list[Statement] = [If(BooleanLiteral(True), [
@@ -505,11 +535,11 @@ class TestEvaluator(unittest.TestCase):
             Print(BinaryExpression(Variable("x"), BinaryOperator.ADDITION, Variable("y")))
         ])]
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [15])
-            output_lines = captured_output.getvalue().strip()
-            self.assertEqual(output_lines, "15")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [15])
+        output_lines = captured_output.getvalue().strip()
+        self.assertEqual(output_lines, "15")
     
     def test_execute_if_followed_by_regular_statement(self) -> None:
         ast: list[Statement] = [
@@ -517,11 +547,11 @@ class TestEvaluator(unittest.TestCase):
             Print(IntegerLiteral(2))
         ]
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [1, 2])
-            output_lines = captured_output.getvalue().strip().split('\n')
-            self.assertEqual(output_lines, ["1", "2"])
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [1, 2])
+        output_lines = captured_output.getvalue().strip().split('\n')
+        self.assertEqual(output_lines, ["1", "2"])
     
     def test_execute_if_variable_scoping(self) -> None:
         # Variables defined inside if should be available outside
@@ -530,11 +560,11 @@ class TestEvaluator(unittest.TestCase):
             Print(Variable("x"))
         ]
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [42])
-            output_lines = captured_output.getvalue().strip()
-            self.assertEqual(output_lines, "42")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [42])
+        output_lines = captured_output.getvalue().strip()
+        self.assertEqual(output_lines, "42")
     
     def test_execute_if_false_no_variable_definition(self) -> None:
         # Variables not defined when if condition is false
@@ -556,11 +586,11 @@ class TestEvaluator(unittest.TestCase):
             Print(Variable("x"))
         ]
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [10])
-            output_lines = captured_output.getvalue().strip()
-            self.assertEqual(output_lines, "10")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [10])
+        output_lines = captured_output.getvalue().strip()
+        self.assertEqual(output_lines, "10")
     
     def test_execute_set_undefined_variable(self) -> None:
         # Test modifying undefined variable should fail
@@ -579,11 +609,11 @@ class TestEvaluator(unittest.TestCase):
             Print(Variable("x"))
         ]
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [8])
-            output_lines = captured_output.getvalue().strip()
-            self.assertEqual(output_lines, "8")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [8])
+        output_lines = captured_output.getvalue().strip()
+        self.assertEqual(output_lines, "8")
     
     # While loop tests
     def test_execute_while_simple_countdown(self) -> None:
@@ -596,11 +626,11 @@ class TestEvaluator(unittest.TestCase):
             ])
         ]
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [3, 2, 1])
-            output_lines = captured_output.getvalue().strip().split('\n')
-            self.assertEqual(output_lines, ["3", "2", "1"])
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [3, 2, 1])
+        output_lines = captured_output.getvalue().strip().split('\n')
+        self.assertEqual(output_lines, ["3", "2", "1"])
     
     def test_execute_while_false_condition(self) -> None:
         # Test while loop with false condition (should not execute body)
@@ -613,11 +643,11 @@ class TestEvaluator(unittest.TestCase):
             Print(Variable("x"))
         ]
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [5])
-            output_lines = captured_output.getvalue().strip()
-            self.assertEqual(output_lines, "5")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [5])
+        output_lines = captured_output.getvalue().strip()
+        self.assertEqual(output_lines, "5")
     
     def test_execute_while_with_complex_condition(self) -> None:
         # Test while loop with complex condition
@@ -631,11 +661,11 @@ class TestEvaluator(unittest.TestCase):
             Print(Variable("sum"))
         ]
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [15])  # 1+2+3+4+5 = 15
-            output_lines = captured_output.getvalue().strip()
-            self.assertEqual(output_lines, "15")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [15])  # 1+2+3+4+5 = 15
+        output_lines = captured_output.getvalue().strip()
+        self.assertEqual(output_lines, "15")
     
     def test_execute_logical_not_program(self) -> None:
         # Test a complete program using logical not
@@ -646,15 +676,13 @@ class TestEvaluator(unittest.TestCase):
             let complex boolean = not (true and false)
             print complex
         """)
-        tokens = tokenize(code)
-        ast = parse(tokens)
-        type_check(ast)
+        ast = compile_cached(code)
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [False, True])
-            output_lines = captured_output.getvalue().strip().split('\n')
-            self.assertEqual(output_lines, ["false", "true"])
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [False, True])
+        output_lines = captured_output.getvalue().strip().split('\n')
+        self.assertEqual(output_lines, ["false", "true"])
     
     def test_execute_logical_not_precedence_program(self) -> None:
         # Test a complete program demonstrating not precedence
@@ -675,15 +703,13 @@ class TestEvaluator(unittest.TestCase):
             let resultThree boolean = not x and y or z
             print resultThree
         """)
-        tokens = tokenize(code)
-        ast = parse(tokens)
-        type_check(ast)
+        ast = compile_cached(code)
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [False, True, True])
-            output_lines = captured_output.getvalue().strip().split('\n')
-            self.assertEqual(output_lines, ["false", "true", "true"])
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [False, True, True])
+        output_lines = captured_output.getvalue().strip().split('\n')
+        self.assertEqual(output_lines, ["false", "true", "true"])
     
     def test_execute_while_nested_statements(self) -> None:
         # Test while loop with multiple statements in body
@@ -697,11 +723,11 @@ class TestEvaluator(unittest.TestCase):
             ])
         ]
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [2, 2])  # result becomes 2, then stays 2 (2*1)
-            output_lines = captured_output.getvalue().strip().split('\n')
-            self.assertEqual(output_lines, ["2", "2"])
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [2, 2])  # result becomes 2, then stays 2 (2*1)
+        output_lines = captured_output.getvalue().strip().split('\n')
+        self.assertEqual(output_lines, ["2", "2"])
     
     def test_execute_while_variable_scoping(self) -> None:
         # Test that variables modified in while loop are visible outside
@@ -713,11 +739,11 @@ class TestEvaluator(unittest.TestCase):
             Print(Variable("x"))
         ]
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [4])  # 10 -> 8 -> 6 -> 4 (stops when x <= 5)
-            output_lines = captured_output.getvalue().strip()
-            self.assertEqual(output_lines, "4")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [4])  # 10 -> 8 -> 6 -> 4 (stops when x <= 5)
+        output_lines = captured_output.getvalue().strip()
+        self.assertEqual(output_lines, "4")
     
     def test_execute_while_followed_by_regular_statement(self) -> None:
         # Test while loop followed by regular statements
@@ -730,11 +756,11 @@ class TestEvaluator(unittest.TestCase):
             Print(IntegerLiteral(99))
         ]
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [1, 2, 99])
-            output_lines = captured_output.getvalue().strip().split('\n')
-            self.assertEqual(output_lines, ["1", "2", "99"])
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [1, 2, 99])
+        output_lines = captured_output.getvalue().strip().split('\n')
+        self.assertEqual(output_lines, ["1", "2", "99"])
     
     def test_execute_while_boolean_condition_modification(self) -> None:
         # Test while loop that modifies boolean variables
@@ -748,11 +774,11 @@ class TestEvaluator(unittest.TestCase):
             ])
         ]
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [1, 2, 3])
-            output_lines = captured_output.getvalue().strip().split('\n')
-            self.assertEqual(output_lines, ["1", "2", "3"])
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [1, 2, 3])
+        output_lines = captured_output.getvalue().strip().split('\n')
+        self.assertEqual(output_lines, ["1", "2", "3"])
     
     # Modulus operator tests
     def test_evaluate_modulus_operation(self) -> None:
@@ -773,11 +799,11 @@ class TestEvaluator(unittest.TestCase):
             Print(Variable("remainder"))
         ]
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [2])
-            output_lines = captured_output.getvalue().strip()
-            self.assertEqual(output_lines, "2")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [2])
+        output_lines = captured_output.getvalue().strip()
+        self.assertEqual(output_lines, "2")
     
     # Float literal tests
     def test_evaluate_float_literal(self) -> None:
@@ -834,11 +860,11 @@ class TestEvaluator(unittest.TestCase):
     def test_execute_print_float(self) -> None:
         ast: list[Statement] = [Print(FloatLiteral(3.14))]
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [3.14])
-            output_lines = captured_output.getvalue().strip()
-            self.assertEqual(output_lines, "3.14")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [3.14])
+        output_lines = captured_output.getvalue().strip()
+        self.assertEqual(output_lines, "3.14")
     
     def test_execute_complex_float_program(self) -> None:
         ast: list[Statement] = [
@@ -849,24 +875,24 @@ class TestEvaluator(unittest.TestCase):
             Print(Variable("area"))
         ]
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            expected_area = 3.14159 * 2.5 * 2.5
-            self.assertEqual(len(results), 1)
-            assert isinstance(results[0], float)
-            self.assertAlmostEqual(results[0], expected_area, places=5)
-            output_lines = captured_output.getvalue().strip()
-            self.assertAlmostEqual(float(output_lines), expected_area, places=5)
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        expected_area = 3.14159 * 2.5 * 2.5
+        self.assertEqual(len(results), 1)
+        assert isinstance(results[0], float)
+        self.assertAlmostEqual(results[0], expected_area, places=5)
+        output_lines = captured_output.getvalue().strip()
+        self.assertAlmostEqual(float(output_lines), expected_area, places=5)
     
     # Comment evaluation tests
     def test_execute_standalone_comment(self) -> None:
         """Test that standalone comments are skipped in evaluation."""
         ast: list[Statement] = [Comment()]
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [])
-            self.assertEqual(captured_output.getvalue(), "")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [])
+        self.assertEqual(captured_output.getvalue(), "")
     
     def test_execute_comment_with_statements(self) -> None:
         """Test that comments are skipped but other statements execute."""
@@ -878,10 +904,10 @@ class TestEvaluator(unittest.TestCase):
             Comment()
         ]
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [42])
-            self.assertEqual(captured_output.getvalue().strip(), "42")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [42])
+        self.assertEqual(captured_output.getvalue().strip(), "42")
     
     def test_execute_comment_only_program(self) -> None:
         """Test that a program with only comments produces no output."""
@@ -891,10 +917,10 @@ class TestEvaluator(unittest.TestCase):
             Comment()
         ]
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [])
-            self.assertEqual(captured_output.getvalue(), "")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [])
+        self.assertEqual(captured_output.getvalue(), "")
     
     def test_execute_comment_in_if_block(self) -> None:
         """Test that comments in if blocks are properly skipped."""
@@ -907,10 +933,10 @@ class TestEvaluator(unittest.TestCase):
             ])
         ]
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [100])
-            self.assertEqual(captured_output.getvalue().strip(), "100")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [100])
+        self.assertEqual(captured_output.getvalue().strip(), "100")
     
     def test_execute_comment_in_while_block(self) -> None:
         """Test that comments in while blocks are properly skipped."""
@@ -924,11 +950,11 @@ class TestEvaluator(unittest.TestCase):
             ])
         ]
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [3, 2, 1])
-            output_lines = captured_output.getvalue().strip().split('\n')
-            self.assertEqual(output_lines, ['3', '2', '1'])
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [3, 2, 1])
+        output_lines = captured_output.getvalue().strip().split('\n')
+        self.assertEqual(output_lines, ['3', '2', '1'])
     
     def test_execute_complex_program_with_comments(self) -> None:
         """Test a complex program with comments throughout."""
@@ -948,10 +974,10 @@ class TestEvaluator(unittest.TestCase):
             Print(Variable("result"))
         ]
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [120])  # 5! = 120
-            self.assertEqual(captured_output.getvalue().strip(), "120")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [120])  # 5! = 120
+        self.assertEqual(captured_output.getvalue().strip(), "120")
     
     # Function execution tests
     def test_execute_simple_function(self) -> None:
@@ -963,14 +989,12 @@ class TestEvaluator(unittest.TestCase):
             print result
         """)
         
-        tokens = tokenize(code)
-        ast = parse(tokens)
-        type_check(ast)
+        ast = compile_cached(code)
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [15])
-            self.assertEqual(captured_output.getvalue().strip(), "15")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [15])
+        self.assertEqual(captured_output.getvalue().strip(), "15")
     
     def test_execute_function_with_variables(self) -> None:
         """Test function that uses local variables."""
@@ -982,14 +1006,12 @@ class TestEvaluator(unittest.TestCase):
             print answer
         """)
         
-        tokens = tokenize(code)
-        ast = parse(tokens)
-        type_check(ast)
+        ast = compile_cached(code)
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [42])
-            self.assertEqual(captured_output.getvalue().strip(), "42")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [42])
+        self.assertEqual(captured_output.getvalue().strip(), "42")
     
     def test_execute_nested_function_calls(self) -> None:
         """Test nested function calls."""
@@ -1002,15 +1024,32 @@ class TestEvaluator(unittest.TestCase):
             print result
         """)
         
-        tokens = tokenize(code)
-        ast = parse(tokens)
-        type_check(ast)
+        ast = compile_cached(code)
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [50])  # (2+3) * (4+6) = 5 * 10 = 50
-            self.assertEqual(captured_output.getvalue().strip(), "50")
-    
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [50])  # (2+3) * (4+6) = 5 * 10 = 50
+        self.assertEqual(captured_output.getvalue().strip(), "50")
+
+    def test_execute_function_nested_and_top_level_returns(self) -> None:
+        """Test a function that can return from inside an if or from its last statement."""
+        code = code_block("""
+            def clamp(x integer) returns integer
+                if x > 10
+                    return 10
+                return x
+            print clamp(3)
+            print clamp(42)
+        """)
+
+        ast = compile_cached(code)
+
+        captured_output = _PrintBuffer()
+        results, cost = execute(ast, sink=captured_output.lines)
+        self.assertEqual(results, [3, 10])
+        self.assertEqual(captured_output.getvalue().strip(), "3\n10")
+        self.assertEqual(cost, 11)
+
     # Comprehensive List Evaluation Tests
     def test_execute_list_literal_integer(self) -> None:
         """Test executing list literal with integers."""
@@ -1019,14 +1058,12 @@ class TestEvaluator(unittest.TestCase):
             print nums
         """)
         
-        tokens = tokenize(code)
-        ast = parse(tokens)
-        type_check(ast)
+        ast = compile_cached(code)
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [1, 2, 3])
-            self.assertEqual(captured_output.getvalue().strip(), "[1, 2, 3]")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [1, 2, 3])
+        self.assertEqual(captured_output.getvalue().strip(), "[1, 2, 3]")
     
     def test_execute_list_literal_boolean(self) -> None:
         """Test executing list literal with booleans."""
@@ -1035,14 +1072,12 @@ class TestEvaluator(unittest.TestCase):
             print flags
         """)
         
-        tokens = tokenize(code)
-        ast = parse(tokens)
-        type_check(ast)
+        ast = compile_cached(code)
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [True, False, True])
-            self.assertEqual(captured_output.getvalue().strip(), "[true, false, true]")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [True, False, True])
+        self.assertEqual(captured_output.getvalue().strip(), "[true, false, true]")
     
     def test_execute_empty_list_via_repeat(self) -> None:
         """Test executing empty list creation using repeat."""
@@ -1051,14 +1086,12 @@ class TestEvaluator(unittest.TestCase):
             print empty
         """)
         
-        tokens = tokenize(code)
-        ast = parse(tokens)
-        type_check(ast)
+        ast = compile_cached(code)
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [])
-            self.assertEqual(captured_output.getvalue().strip(), "[]")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [])
+        self.assertEqual(captured_output.getvalue().strip(), "[]")
     
     def test_execute_repeat_function(self) -> None:
         """Test executing repeat function."""
@@ -1067,14 +1100,12 @@ class TestEvaluator(unittest.TestCase):
             print zeros
         """)
         
-        tokens = tokenize(code)
-        ast = parse(tokens)
-        type_check(ast)
+        ast = compile_cached(code)
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [0, 0, 0, 0, 0])
-            self.assertEqual(captured_output.getvalue().strip(), "[0, 0, 0, 0, 0]")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [0, 0, 0, 0, 0])
+        self.assertEqual(captured_output.getvalue().strip(), "[0, 0, 0, 0, 0]")
     
     def test_execute_repeat_function_with_boolean(self) -> None:
         """Test executing repeat function with boolean."""
@@ -1083,14 +1114,12 @@ class TestEvaluator(unittest.TestCase):
             print flags
         """)
         
-        tokens = tokenize(code)
-        ast = parse(tokens)
-        type_check(ast)
+        ast = compile_cached(code)
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [True, True, True])
-            self.assertEqual(captured_output.getvalue().strip(), "[true, true, true]")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [True, True, True])
+        self.assertEqual(captured_output.getvalue().strip(), "[true, true, true]")
     
     def test_execute_list_access(self) -> None:
         """Test executing list access."""
@@ -1101,14 +1130,12 @@ class TestEvaluator(unittest.TestCase):
             print nums[2]
         """)
         
-        tokens = tokenize(code)
-        ast = parse(tokens)
-        type_check(ast)
+        ast = compile_cached(code)
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [10, 20, 30])
-            self.assertEqual(captured_output.getvalue().strip(), "10\n20\n30")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [10, 20, 30])
+        self.assertEqual(captured_output.getvalue().strip(), "10\n20\n30")
     
     def test_execute_list_access_with_variable(self) -> None:
         """Test executing list access with variable index."""
@@ -1118,14 +1145,12 @@ class TestEvaluator(unittest.TestCase):
             print nums[i]
         """)
         
-        tokens = tokenize(code)
-        ast = parse(tokens)
-        type_check(ast)
+        ast = compile_cached(code)
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [20])
-            self.assertEqual(captured_output.getvalue().strip(), "20")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [20])
+        self.assertEqual(captured_output.getvalue().strip(), "20")
     
     def test_execute_len_function(self) -> None:
         """Test executing len function."""
@@ -1134,14 +1159,12 @@ class TestEvaluator(unittest.TestCase):
             print len(nums)
         """)
         
-        tokens = tokenize(code)
-        ast = parse(tokens)
-        type_check(ast)
+        ast = compile_cached(code)
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [5])
-            self.assertEqual(captured_output.getvalue().strip(), "5")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [5])
+        self.assertEqual(captured_output.getvalue().strip(), "5")
     
     def test_execute_len_function_empty_list(self) -> None:
         """Test executing len function on empty list."""
@@ -1150,14 +1173,12 @@ class TestEvaluator(unittest.TestCase):
             print len(empty)
         """)
         
-        tokens = tokenize(code)
-        ast = parse(tokens)
-        type_check(ast)
+        ast = compile_cached(code)
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [0])
-            self.assertEqual(captured_output.getvalue().strip(), "0")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [0])
+        self.assertEqual(captured_output.getvalue().strip(), "0")
     
     def test_execute_list_assignment(self) -> None:
         """Test executing list assignment."""
@@ -1167,14 +1188,12 @@ class TestEvaluator(unittest.TestCase):
             print nums
         """)
         
-        tokens = tokenize(code)
-        ast = parse(tokens)
-        type_check(ast)
+        ast = compile_cached(code)
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [1, 42, 3])
-            self.assertEqual(captured_output.getvalue().strip(), "[1, 42, 3]")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [1, 42, 3])
+        self.assertEqual(captured_output.getvalue().strip(), "[1, 42, 3]")
     
     def test_execute_list_assignment_with_expression(self) -> None:
         """Test executing list assignment with expression."""
@@ -1185,14 +1204,12 @@ class TestEvaluator(unittest.TestCase):
             print nums
         """)
         
-        tokens = tokenize(code)
-        ast = parse(tokens)
-        type_check(ast)
+        ast = compile_cached(code)
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [20, 2, 3])
-            self.assertEqual(captured_output.getvalue().strip(), "[20, 2, 3]")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [20, 2, 3])
+        self.assertEqual(captured_output.getvalue().strip(), "[20, 2, 3]")
     
     def test_execute_list_with_expressions(self) -> None:
         """Test executing list with expression elements."""
@@ -1203,14 +1220,12 @@ class TestEvaluator(unittest.TestCase):
             print computed
         """)
         
-        tokens = tokenize(code)
-        ast = parse(tokens)
-        type_check(ast)
+        ast = compile_cached(code)
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [11, 40, 99])
-            self.assertEqual(captured_output.getvalue().strip(), "[11, 40, 99]")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [11, 40, 99])
+        self.assertEqual(captured_output.getvalue().strip(), "[11, 40, 99]")
     
     def test_execute_complex_list_operations(self) -> None:
         """Test executing complex list operations."""
@@ -1222,15 +1237,54 @@ class TestEvaluator(unittest.TestCase):
             print nums
         """)
         
-        tokens = tokenize(code)
-        ast = parse(tokens)
-        type_check(ast)
+        ast = compile_cached(code)
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [3, 13, 13, 2, 3])
-            self.assertEqual(captured_output.getvalue().strip(), "3\n13\n[13, 2, 3]")
-    
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [3, 13, 13, 2, 3])
+        self.assertEqual(captured_output.getvalue().strip(), "3\n13\n[13, 2, 3]")
+
+    def test_execute_list_assignment_does_not_affect_copies(self) -> None:
+        """Test that writing to a list leaves other bindings of it unchanged."""
+        code = code_block("""
+            let original list of integer = [1, 2, 3]
+            let copy list of integer = original
+            set original[0] = 10
+            set original[1] = 20
+            set copy[2] = 30
+            print original
+            print copy
+        """)
+
+        ast = compile_cached(code)
+
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [10, 20, 3, 1, 2, 30])
+        self.assertEqual(captured_output.getvalue().strip(), "[10, 20, 3]\n[1, 2, 30]")
+
+    def test_execute_list_assignment_in_function_does_not_affect_caller(self) -> None:
+        """Test that a function writing to a list parameter leaves the caller's list unchanged."""
+        code = code_block("""
+            def zerofirst(nums list of integer) returns list of integer
+                set nums[0] = 0
+                set nums[1] = 0
+                return nums
+
+            let values list of integer = [5, 6, 7]
+            let zeroed list of integer = zerofirst(values)
+            set zeroed[2] = 0
+            print values
+            print zeroed
+        """)
+
+        ast = compile_cached(code)
+
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [5, 6, 7, 0, 0, 0])
+        self.assertEqual(captured_output.getvalue().strip(), "[5, 6, 7]\n[0, 0, 0]")
+
     def test_execute_list_in_function(self) -> None:
         """Test executing list operations in function."""
         code = code_block("""
@@ -1242,14 +1296,12 @@ class TestEvaluator(unittest.TestCase):
             print first
         """)
         
-        tokens = tokenize(code)
-        ast = parse(tokens)
-        type_check(ast)
+        ast = compile_cached(code)
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [100])
-            self.assertEqual(captured_output.getvalue().strip(), "100")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [100])
+        self.assertEqual(captured_output.getvalue().strip(), "100")
     
     def test_execute_function_returning_list(self) -> None:
         """Test executing function that returns a list."""
@@ -1261,14 +1313,12 @@ class TestEvaluator(unittest.TestCase):
             print result
         """)
         
-        tokens = tokenize(code)
-        ast = parse(tokens)
-        type_check(ast)
+        ast = compile_cached(code)
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [1, 2, 3])
-            self.assertEqual(captured_output.getvalue().strip(), "[1, 2, 3]")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [1, 2, 3])
+        self.assertEqual(captured_output.getvalue().strip(), "[1, 2, 3]")
     
     # List error tests
     def test_execute_list_access_out_of_bounds_positive(self) -> None:
@@ -1278,9 +1328,7 @@ class TestEvaluator(unittest.TestCase):
             print nums[5]
         """)
         
-        tokens = tokenize(code)
-        ast = parse(tokens)
-        type_check(ast)
+        ast = compile_cached(code)
         
         with self.assertRaises(EvaluationError) as cm:
             execute(ast)
@@ -1294,9 +1342,7 @@ class TestEvaluator(unittest.TestCase):
             print nums[negindex]
         """)
         
-        tokens = tokenize(code)
-        ast = parse(tokens)
-        type_check(ast)
+        ast = compile_cached(code)
         
         with self.assertRaises(EvaluationError) as cm:
             execute(ast)
@@ -1309,9 +1355,7 @@ class TestEvaluator(unittest.TestCase):
             set nums[10] = 42
         """)
         
-        tokens = tokenize(code)
-        ast = parse(tokens)
-        type_check(ast)
+        ast = compile_cached(code)
         
         with self.assertRaises(EvaluationError) as cm:
             execute(ast)
@@ -1324,9 +1368,7 @@ class TestEvaluator(unittest.TestCase):
             let nums list of integer = repeat(1, negcount)
         """)
         
-        tokens = tokenize(code)
-        ast = parse(tokens)
-        type_check(ast)
+        ast = compile_cached(code)
         
         with self.assertRaises(EvaluationError) as cm:
             execute(ast)
@@ -1368,10 +1410,10 @@ class TestEvaluator(unittest.TestCase):
             Print(Variable("x"))
         ]
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [-42])
-            self.assertEqual(captured_output.getvalue().strip(), "-42")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [-42])
+        self.assertEqual(captured_output.getvalue().strip(), "-42")
     
     def test_execute_negative_float_let(self) -> None:
         """Test executing let statement with negative float."""
@@ -1380,10 +1422,10 @@ class TestEvaluator(unittest.TestCase):
             Print(Variable("pi"))
         ]
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [-3.14])
-            self.assertEqual(captured_output.getvalue().strip(), "-3.14")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [-3.14])
+        self.assertEqual(captured_output.getvalue().strip(), "-3.14")
     
     def test_execute_negative_arithmetic(self) -> None:
         """Test executing arithmetic with negative numbers."""
@@ -1392,10 +1434,10 @@ class TestEvaluator(unittest.TestCase):
             Print(Variable("result"))
         ]
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [-2])
-            self.assertEqual(captured_output.getvalue().strip(), "-2")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [-2])
+        self.assertEqual(captured_output.getvalue().strip(), "-2")
     
     def test_execute_mixed_negative_positive_arithmetic(self) -> None:
         """Test executing arithmetic with both negative and positive numbers."""
@@ -1406,10 +1448,10 @@ class TestEvaluator(unittest.TestCase):
             Print(Variable("result"))
         ]
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [-7])  # -10 + 5 - 2 = -7
-            self.assertEqual(captured_output.getvalue().strip(), "-7")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [-7])  # -10 + 5 - 2 = -7
+        self.assertEqual(captured_output.getvalue().strip(), "-7")
     
     def test_execute_negative_float_arithmetic(self) -> None:
         """Test executing arithmetic with negative floats."""
@@ -1418,10 +1460,10 @@ class TestEvaluator(unittest.TestCase):
             Print(Variable("result"))
         ]
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [-10.0])
-            self.assertEqual(captured_output.getvalue().strip(), "-10.0")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [-10.0])
+        self.assertEqual(captured_output.getvalue().strip(), "-10.0")
     
     def test_execute_negative_comparison(self) -> None:
         """Test executing comparison with negative numbers."""
@@ -1430,10 +1472,10 @@ class TestEvaluator(unittest.TestCase):
             Print(Variable("result"))
         ]
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [True])
-            self.assertEqual(captured_output.getvalue().strip(), "true")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [True])
+        self.assertEqual(captured_output.getvalue().strip(), "true")
     
     def test_execute_negative_in_list(self) -> None:
         """Test executing list operations with negative numbers."""
@@ -1443,14 +1485,12 @@ class TestEvaluator(unittest.TestCase):
             print nums[0]
         """)
         
-        tokens = tokenize(code)
-        ast = parse(tokens)
-        type_check(ast)
+        ast = compile_cached(code)
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [-1, -2, -3, -1])
-            self.assertEqual(captured_output.getvalue().strip(), "[-1, -2, -3]\n-1")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [-1, -2, -3, -1])
+        self.assertEqual(captured_output.getvalue().strip(), "[-1, -2, -3]\n-1")
     
     def test_execute_negative_in_function_call(self) -> None:
         """Test executing function calls with negative arguments."""
@@ -1461,14 +1501,12 @@ class TestEvaluator(unittest.TestCase):
             print result
         """)
         
-        tokens = tokenize(code)
-        ast = parse(tokens)
-        type_check(ast)
+        ast = compile_cached(code)
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [5])
-            self.assertEqual(captured_output.getvalue().strip(), "5")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [5])
+        self.assertEqual(captured_output.getvalue().strip(), "5")
     
     def test_execute_complex_negative_program(self) -> None:
         """Test executing a complex program with negative numbers."""
@@ -1482,14 +1520,12 @@ class TestEvaluator(unittest.TestCase):
             print floatResult
         """)
         
-        tokens = tokenize(code)
-        ast = parse(tokens)
-        type_check(ast)
+        ast = compile_cached(code)
         
-        with self.capture_stdout() as captured_output:
-            results = execute(ast)[0]
-            self.assertEqual(results, [-5, 5.0])
-            self.assertEqual(captured_output.getvalue().strip(), "-5\n5.0")
+        captured_output = _PrintBuffer()
+        results = execute(ast, sink=captured_output.lines)[0]
+        self.assertEqual(results, [-5, 5.0])
+        self.assertEqual(captured_output.getvalue().strip(), "-5\n5.0")
 
 
 if __name__ == '__main__':
@@ -1,15 +1,46 @@
 #!/usr/bin/env python3
 
-import sys
 from typing import Sequence
 import unittest
-from io import StringIO
 
-from metric.tokenizer import tokenize
-from metric.parser import parse, ParseError
-from metric.type_checker import type_check, TypeCheckError
+from metric.parser import ParseError
+from metric.type_checker import TypeCheckError
 from metric.evaluator import RuntimeValue, execute, EvaluationError
-from test.test_utils import code_block
+from test.test_utils import code_block, compile_cached
+
+
+_TYPE_ERROR_CASES: tuple[tuple[str, type[Exception], str], ...] = (
+    ("let mixed list of integer = [1, true]", TypeCheckError, "homogeneous"),
+    ("let nums list of integer = [1, 2]\nset nums[0] = true", TypeCheckError, "type mismatch"),
+    ("let nums list of integer = [1, 2]\nprint nums[true]", TypeCheckError, "index must be integer"),
+    ("let x integer = 5\nprint x[0]", TypeCheckError, "cannot index into non-list"),
+    ("let x integer = 5\nprint len(x)", TypeCheckError, "cannot get length of non-list"),
+)
+
+_RUNTIME_ERROR_CASES: tuple[tuple[str, type[Exception], str], ...] = (
+    ("let nums list of integer = [1, 2, 3]\nprint nums[5]", EvaluationError, "out of bounds"),
+    ("let nums list of integer = [1, 2, 3]\nlet negindex integer = 0 - 1\nprint nums[negindex]", EvaluationError, "out of bounds"),
+    ("let nums list of integer = [1, 2, 3]\nset nums[10] = 42", EvaluationError, "out of bounds"),
+    ("let negcount integer = 0 - 5\nlet nums list of integer = repeat(1, negcount)", EvaluationError, "negative"),
+)
+
+_PARSER_ERROR_CASES: tuple[tuple[str, type[Exception], str], ...] = (
+    ("let nums list integer = [1, 2, 3]", ParseError, "of"),
+    ("let nums list of integer = [1, 2, 3", ParseError, "]"),
+    ("print nums[0", ParseError, "]"),
+    ("let nums list of integer = repeat 0, 5", ParseError, "("),
+    ("print len nums", ParseError, "("),
+)
+
+_EXPECTED_COMPREHENSIVE_OUTPUT = "\n".join([
+    "[3, 1, 4, 1, 5, 9, 2, 6]",
+    "8",
+    "9",
+    "true",
+    "false",
+    "[9, 1, 4, 1, 5, 9, 2, 6]",
+    "[18, 18, 18]",
+])
 
 
 class TestListFeatures(unittest.TestCase):
@@ -17,28 +48,27 @@ class TestListFeatures(unittest.TestCase):
     
     def _run_code(self, code: str) -> tuple[Sequence[RuntimeValue], str]:
         """Helper to run code through full pipeline and capture output."""
-        tokens = tokenize(code)
-        ast = parse(tokens)
-        type_check(ast)
-        
-        captured_output = StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = captured_output
+        ast = compile_cached(code)
         
-        try:
-            _ = execute(ast)[0]
-            output = captured_output.getvalue().strip()
-            return _, output
-        finally:
-            sys.stdout = old_stdout
+        sink: list[str] = []
+        _ = execute(ast, sink=sink)[0]
+        return _, "\n".join(sink)
     
     def _expect_error(self, code: str, error_type: type[Exception], error_keyword: str) -> None:
-        """Helper to expect a specific error."""
+        """Helper to expect a specific error; `error_keyword` is given in lower case."""
         try:
             self._run_code(code)
             self.fail(f"Expected {error_type.__name__} containing '{error_keyword}'")
         except error_type as e:
-            self.assertIn(error_keyword.lower(), str(e).lower())
+            self.assertIn(error_keyword, str(e).lower())
+    
+    def _expect_errors(self, error_cases: Sequence[tuple[str, type[Exception], str]]) -> None:
+        """Helper to expect an error for each (code, error_type, keyword) case."""
+        expect_error = self._expect_error
+        sub_test = self.subTest
+        for code, error_type, keyword in error_cases:
+            with sub_test(code=code):
+                expect_error(code, error_type, keyword)
     
     def test_list_basic_operations(self) -> None:
         """Test basic list operations work together."""
@@ -227,44 +257,15 @@ class TestListFeatures(unittest.TestCase):
     # Error handling tests
     def test_list_type_errors(self) -> None:
         """Test list type checking errors."""
-        error_cases = [
-            ("let mixed list of integer = [1, true]", TypeCheckError, "homogeneous"),
-            ("let nums list of integer = [1, 2]\nset nums[0] = true", TypeCheckError, "type mismatch"),
-            ("let nums list of integer = [1, 2]\nprint nums[true]", TypeCheckError, "index must be integer"),
-            ("let x integer = 5\nprint x[0]", TypeCheckError, "cannot index into non-list"),
-            ("let x integer = 5\nprint len(x)", TypeCheckError, "cannot get length of non-list"),
-        ]
-        
-        for code, error_type, keyword in error_cases:
-            with self.subTest(code=code):
-                self._expect_error(code, error_type, keyword)
+        self._expect_errors(_TYPE_ERROR_CASES)
     
     def test_list_runtime_errors(self) -> None:
         """Test list runtime errors."""
-        error_cases = [
-            ("let nums list of integer = [1, 2, 3]\nprint nums[5]", EvaluationError, "out of bounds"),
-            ("let nums list of integer = [1, 2, 3]\nlet negindex integer = 0 - 1\nprint nums[negindex]", EvaluationError, "out of bounds"),
-            ("let nums list of integer = [1, 2, 3]\nset nums[10] = 42", EvaluationError, "out of bounds"),
-            ("let negcount integer = 0 - 5\nlet nums list of integer = repeat(1, negcount)", EvaluationError, "negative"),
-        ]
-        
-        for code, error_type, keyword in error_cases:
-            with self.subTest(code=code):
-                self._expect_error(code, error_type, keyword)
+        self._expect_errors(_RUNTIME_ERROR_CASES)
     
     def test_list_parser_errors(self) -> None:
         """Test list parsing errors."""
-        error_cases = [
-            ("let nums list integer = [1, 2, 3]", ParseError, "of"),
-            ("let nums list of integer = [1, 2, 3", ParseError, "]"),
-            ("print nums[0", ParseError, "]"),
-            ("let nums list of integer = repeat 0, 5", ParseError, "("),
-            ("print len nums", ParseError, "("),
-        ]
-        
-        for code, error_type, keyword in error_cases:
-            with self.subTest(code=code):
-                self._expect_error(code, error_type, keyword)
+        self._expect_errors(_PARSER_ERROR_CASES)
     
     def test_list_comprehensive_program(self) -> None:
         """Test a comprehensive program using all list features."""
@@ -307,16 +308,7 @@ class TestListFeatures(unittest.TestCase):
         """)
         
         _, output = self._run_code(code)
-        expected_lines = [
-            "[3, 1, 4, 1, 5, 9, 2, 6]",
-            "8",
-            "9",
-            "true",
-            "false",
-            "[9, 1, 4, 1, 5, 9, 2, 6]",
-            "[18, 18, 18]"
-        ]
-        self.assertEqual(output, "\n".join(expected_lines))
+        self.assertEqual(output, _EXPECTED_COMPREHENSIVE_OUTPUT)
 
 
 if __name__ == '__main__':
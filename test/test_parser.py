@@ -1,31 +1,41 @@
 #!/usr/bin/env python3
 
 import unittest
+from functools import lru_cache
 from metric.parser import parse, ParseError
 from metric.tokenizer import TokenType, tokenize, Token, IntegerToken, IdentifierToken
 from metric.metric_ast import *
-from test.test_utils import code_block
+from test.test_utils import code_block, tokenize_cached
 from typing import Sequence
 
 
+@lru_cache(maxsize=None)
+def _parse(code: str) -> AbstractSyntaxTree:
+    """Parse each distinct source string once; tests only compare the result."""
+    return parse(list(tokenize_cached(code)))
+
+
 class TestParser(unittest.TestCase):
     
     # Helper methods for cleaner test construction
     def _parse_expression(self, code: str) -> Sequence[Statement]:
         """Helper to parse code string directly."""
-        tokens: list[TokenType] =tokenize(code)
-        return parse(tokens)
+        return _parse(code)
     
     def _assert_parse_equals(self, code: str, expected_ast: list[Statement]) -> None:
         """Helper to parse and assert equality."""
         actual_ast = self._parse_expression(code)
-        self.assertEqual(actual_ast, expected_ast)
+        if actual_ast != expected_ast:
+            self.assertEqual(actual_ast, expected_ast)
     
     def _assert_parse_error(self, code: str, expected_error: str) -> None:
         """Helper to assert parse errors."""
-        with self.assertRaises(ParseError) as cm:
+        try:
             self._parse_expression(code)
-        self.assertEqual(str(cm.exception), expected_error)
+        except ParseError as e:
+            self.assertEqual(str(e), expected_error)
+        else:
+            self.fail(f"Expected ParseError: {expected_error}")
     
     def _let_stmt(self, name: str, type_: Type, expr: Expression) -> Let:
         """Helper to create Let statements."""
@@ -51,24 +61,34 @@ class TestParser(unittest.TestCase):
         """Helper to create binary expressions."""
         return BinaryExpression(left, op, right)
     
-    def _int_lit(self, value: int) -> IntegerLiteral:
-        """Helper to create integer literals."""
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _int_lit(value: int) -> IntegerLiteral:
+        """Helper to create shared integer literals."""
         return IntegerLiteral(value)
     
-    def _float_lit(self, value: float) -> FloatLiteral:
-        """Helper to create float literals."""
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _float_lit(value: float) -> FloatLiteral:
+        """Helper to create shared float literals."""
         return FloatLiteral(value)
     
-    def _bool_lit(self, value: bool) -> BooleanLiteral:
-        """Helper to create boolean literals."""
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _bool_lit(value: bool) -> BooleanLiteral:
+        """Helper to create shared boolean literals."""
         return BooleanLiteral(value)
     
-    def _var(self, name: str) -> Variable:
-        """Helper to create variables."""
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _var(name: str) -> Variable:
+        """Helper to create shared variables."""
         return Variable(name)
     
-    def _comment(self)  -> Comment:
-        """Helper to create comments."""
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _comment() -> Comment:
+        """Helper to create a shared comment."""
         return Comment()
     
     def _unary_expr(self, op: 'UnaryOperator', operand: Expression) -> 'UnaryExpression':
@@ -79,7 +99,18 @@ class TestParser(unittest.TestCase):
     def test_parse_simple_integer(self)  -> None:
         expected: list[Statement] = [self._let_stmt("x", Type.INTEGER, self._int_lit(42))]
         self._assert_parse_equals("let x integer = 42", expected)
-    
+
+    def test_parse_shares_small_literals(self)  -> None:
+        ast = parse(tokenize("print 1 + 1\nprint 1000 + 1000\nprint true and true\nprint y * y"))
+        small, large, boolean, variable = (stmt.expression for stmt in ast if isinstance(stmt, Print))
+        assert isinstance(small, BinaryExpression) and isinstance(large, BinaryExpression) and isinstance(boolean, BinaryExpression)
+        assert isinstance(variable, BinaryExpression)
+        self.assertIs(small.left, small.right)
+        self.assertIs(boolean.left, boolean.right)
+        self.assertIs(variable.left, variable.right)
+        self.assertEqual(large.left, large.right)
+        self.assertIsNot(large.left, large.right)
+
     def test_parse_simple_variable_reference(self)  -> None:
         expected: list[Statement] = [self._print_stmt(self._var("x"))]
         self._assert_parse_equals("print x", expected)
@@ -201,7 +232,15 @@ class TestParser(unittest.TestCase):
         ast = parse(tokens)
         expected: list[Statement] = [Let("x", Type.INTEGER, IntegerLiteral(1))]
         self.assertEqual(ast, expected)
-    
+
+    def test_parse_let_integer_literal_then_expression(self)  -> None:
+        expected: list[Statement] = [
+            self._let_stmt("x", Type.INTEGER, self._int_lit(7)),
+            self._let_stmt("y", Type.INTEGER, self._binary_expr(self._int_lit(7), BinaryOperator.MULTIPLICATION, self._int_lit(2))),
+            self._if_stmt(self._bool_lit(True), [self._let_stmt("z", Type.FLOAT, self._int_lit(1))])
+        ]
+        self._assert_parse_equals("let x integer = 7\nlet y integer = 7 * 2\nif true\n    let z float = 1", expected)
+
     # Error handling tests
     def test_parse_error_empty_tokens(self)  -> None:
         tokens: list[TokenType] =[]
@@ -226,6 +265,11 @@ class TestParser(unittest.TestCase):
             parse(tokens)
         self.assertEqual(str(cm.exception), "Expected 'let identifier type = expression'")
     
+    def test_parse_error_let_list_missing_of_before_literal(self)  -> None:
+        """A lone integer after a list type still reports the missing 'of'."""
+        self._assert_parse_error("let x list = 5", "Expected 'of' after 'list'")
+        self._assert_parse_error("let x list = 5 + 1", "Expected 'of' after 'list'")
+
     def test_parse_error_unmatched_parenthesis(self)  -> None:
         tokens: list[TokenType] =[Token.LET, IdentifierToken("x"), Token.INTEGER_TYPE, Token.ASSIGN, Token.LEFT_PARENTHESIS, IntegerToken(5)]
         with self.assertRaises(ParseError) as cm:
@@ -859,33 +903,23 @@ class TestParser(unittest.TestCase):
     # List parsing error tests
     def test_parse_error_list_missing_of(self)  -> None:
         """Test parsing error when 'of' is missing in list type."""
-        with self.assertRaises(ParseError) as cm:
-            parse(tokenize("let nums list integer = [1, 2, 3]"))
-        self.assertEqual(str(cm.exception), "Expected 'of' after 'list'")
+        self._assert_parse_error("let nums list integer = [1, 2, 3]", "Expected 'of' after 'list'")
     
     def test_parse_error_list_missing_closing_bracket(self)  -> None:
         """Test parsing error when closing bracket is missing."""
-        with self.assertRaises(ParseError) as cm:
-            parse(tokenize("let nums list of integer = [1, 2, 3"))
-        self.assertEqual(str(cm.exception), "Expected ']' after list elements")
+        self._assert_parse_error("let nums list of integer = [1, 2, 3", "Expected ']' after list elements")
     
     def test_parse_error_list_access_missing_closing_bracket(self)  -> None:
         """Test parsing error when list access missing closing bracket."""
-        with self.assertRaises(ParseError) as cm:
-            parse(tokenize("print nums[0"))
-        self.assertEqual(str(cm.exception), "Expected ']' after list index")
+        self._assert_parse_error("print nums[0", "Expected ']' after list index")
     
     def test_parse_error_repeat_missing_parenthesis(self)  -> None:
         """Test parsing error when repeat is missing parenthesis."""
-        with self.assertRaises(ParseError) as cm:
-            parse(tokenize("let nums list of integer = repeat 0, 5"))
-        self.assertEqual(str(cm.exception), "Expected '(' after 'repeat'")
+        self._assert_parse_error("let nums list of integer = repeat 0, 5", "Expected '(' after 'repeat'")
     
     def test_parse_error_len_missing_parenthesis(self)  -> None:
         """Test parsing error when len is missing parenthesis."""
-        with self.assertRaises(ParseError) as cm:
-            parse(tokenize("print len nums"))
-        self.assertEqual(str(cm.exception), "Expected '(' after 'len'")
+        self._assert_parse_error("print len nums", "Expected '(' after 'len'")
     
     # Negative number parsing tests
     def test_parse_negative_integer(self)  -> None:
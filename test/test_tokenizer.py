@@ -19,6 +19,11 @@ class TestTokenizer(unittest.TestCase):
                    Token.PRINT, IdentifierToken("x")]
         self.assertEqual(result, expected)
     
+    def test_tokens_are_hashable(self)  -> None:
+        result = tokenize("let x float = 1.5 + 2")
+        self.assertEqual(hash(tuple(result)), hash(tuple(tokenize("let x float = 1.5 + 2"))))
+        self.assertIn(FloatToken(1.5), set(result))
+
     def test_tokenize_single_digit(self)  -> None:
         result = tokenize("5")
         self.assertEqual(result, [IntegerToken(5)])
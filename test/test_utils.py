@@ -1,8 +1,29 @@
 #!/usr/bin/env python3
 
 import textwrap
+from functools import lru_cache
 
+from metric.metric_ast import AbstractSyntaxTree
+from metric.parser import parse
+from metric.tokenizer import TokenType, tokenize
+from metric.type_checker import type_check
 
+
+@lru_cache(maxsize=None)
 def code_block(text: str) -> str:
     """Helper function to dedent and strip code blocks for tests."""
-    return textwrap.dedent(text).strip()
\ No newline at end of file
+    return textwrap.dedent(text).strip()
+
+
+@lru_cache(maxsize=None)
+def tokenize_cached(code: str) -> tuple[TokenType, ...]:
+    """Tokenize each distinct source string once; the tuple keeps callers from sharing a mutable list."""
+    return tuple(tokenize(code))
+
+
+@lru_cache(maxsize=None)
+def compile_cached(code: str) -> AbstractSyntaxTree:
+    """Tokenize, parse and type check a program once per distinct source string."""
+    ast = parse(list(tokenize_cached(code)))
+    type_check(ast)
+    return ast